@@ -14,13 +14,19 @@ import sys
 # SECTION 1: SUMO ENVIRONMENT SETUP
 # ─────────────────────────────────────────────────────────────────────────────
 
+# Looked up ONCE at import time — os.environ proxies to the OS environment,
+# so every .get() is a real lookup. Everything that needs SUMO_HOME
+# (setup_sumo_path, the Chunk 1 test) shares this single read.
+_SUMO_HOME = os.environ.get("SUMO_HOME")
+
+
 def setup_sumo_path():
     """
     Adds SUMO tools to Python path so TraCI can be imported.
-    Reads SUMO_HOME environment variable.
+    Reads SUMO_HOME environment variable (cached at import).
     Must be called before 'import traci'.
     """
-    sumo_home = os.environ.get("SUMO_HOME")
+    sumo_home = _SUMO_HOME
     if sumo_home is None:
         raise EnvironmentError(
             "\n[CONFIG ERROR] SUMO_HOME environment variable is NOT set.\n"
@@ -64,6 +70,8 @@ SUMO_OPTIONS    = [
     "--start",                         # auto-start (no manual play needed for sumo-gui)
     "--quit-on-end",                   # close GUI when sim ends
     "--no-warnings",                   # suppress non-critical warnings
+    "--no-step-log",                   # no per-step stdout (write() per step otherwise)
+    "--xml-validation", "never",       # inputs are fixed — skip schema validation at load
     "--step-length", "1.0",           # 1 second per simulation step
     "--log", os.path.join(LOGS_DIR, "sumo_runtime.log"),  # SUMO's own log
 ]
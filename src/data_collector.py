@@ -42,8 +42,25 @@ SUMO TRACI APIS USED:
 """
 
 import traci
+import traci.constants as tc
 from phase_mapper import PhaseLaneMapper
 
+# Per-lane variables collect() needs every step. Used for bulk
+# subscriptions so one batched transfer replaces four round-trips per lane.
+_LANE_VARS = [
+    tc.LAST_STEP_VEHICLE_NUMBER,
+    tc.LAST_STEP_VEHICLE_HALTING_NUMBER,
+    tc.VAR_WAITING_TIME,
+    tc.LAST_STEP_MEAN_SPEED,
+]
+
+# Simulation-level variables collect_network_summary() reads every step.
+_SIM_VARS = [
+    tc.VAR_TIME,
+    tc.VAR_DEPARTED_VEHICLES_NUMBER,
+    tc.VAR_ARRIVED_VEHICLES_NUMBER,
+]
+
 
 class TrafficDataCollector:
     """
@@ -106,6 +123,48 @@ class TrafficDataCollector:
         # Step counter for internal use
         self._step_count = 0
 
+        # True once subscribe_lanes() has been called — collect() then reads
+        # lane data from the per-step subscription batch instead of polling.
+        self._use_subscriptions = False
+
+        # Same switch for the simulation-level summary variables.
+        self._sim_subscribed = False
+
+    # ── OPTIONAL BULK SUBSCRIPTIONS ───────────────────────────────────────────
+
+    def subscribe_lanes(self) -> int:
+        """
+        Subscribe every mapped controlled lane to the per-step metrics
+        collect() reads. After this, each collect() call pulls the whole
+        network's lane data from one batched transfer instead of issuing
+        four TraCI round-trips per lane.
+
+        Call ONCE after the mapper is built (i.e. after traci.start()).
+        Returns the number of lanes subscribed.
+        """
+        lanes = set()
+        for tlsID in self._mapper.get_all_tls_ids():
+            lanes.update(self._mapper.get_all_controlled_lanes(tlsID))
+
+        for lane in lanes:
+            try:
+                traci.lane.subscribe(lane, _LANE_VARS)
+            except traci.exceptions.TraCIException:
+                continue   # internal/inaccessible lane — collect() falls back
+
+        self._use_subscriptions = True
+        return len(lanes)
+
+    def subscribe_simulation(self):
+        """
+        Subscribe to the simulation-level variables used by
+        collect_network_summary(), replacing its three per-call polls
+        (time, departed, arrived) with reads from the step's batch.
+        Call ONCE after traci.start().
+        """
+        traci.simulation.subscribe(_SIM_VARS)
+        self._sim_subscribed = True
+
     # ── PER-TLS DATA COLLECTION ───────────────────────────────────────────────
 
     def collect(self, tlsID: str) -> dict:
@@ -125,6 +184,10 @@ class TrafficDataCollector:
         green_phases = self._mapper.get_green_phase_indices(tlsID)
         result       = {}
 
+        # One batched fetch covers every subscribed lane ({} before the
+        # first simulationStep after subscribing — the getters cover that).
+        sub_all = traci.lane.getAllSubscriptionResults() if self._use_subscriptions else None
+
         for phase_idx in green_phases:
             lanes = self._mapper.get_green_lanes(tlsID, phase_idx)
 
@@ -141,10 +204,17 @@ class TrafficDataCollector:
 
             for lane in lanes:
                 try:
-                    count   = traci.lane.getLastStepVehicleNumber(lane)
-                    halting = traci.lane.getLastStepHaltingNumber(lane)
-                    wait    = traci.lane.getWaitingTime(lane)
-                    speed   = traci.lane.getLastStepMeanSpeed(lane)
+                    sub = sub_all.get(lane) if sub_all is not None else None
+                    if sub is not None:
+                        count   = sub[tc.LAST_STEP_VEHICLE_NUMBER]
+                        halting = sub[tc.LAST_STEP_VEHICLE_HALTING_NUMBER]
+                        wait    = sub[tc.VAR_WAITING_TIME]
+                        speed   = sub[tc.LAST_STEP_MEAN_SPEED]
+                    else:
+                        count   = traci.lane.getLastStepVehicleNumber(lane)
+                        halting = traci.lane.getLastStepHaltingNumber(lane)
+                        wait    = traci.lane.getWaitingTime(lane)
+                        speed   = traci.lane.getLastStepMeanSpeed(lane)
                     length  = self._mapper.get_lane_length(lane)
 
                     # ── CRITICAL FIX: free-flow speed when empty ──────────────
@@ -222,9 +292,15 @@ class TrafficDataCollector:
         self._step_count += 1
 
         try:
-            sim_time = traci.simulation.getTime()
-            departed = traci.simulation.getDepartedNumber()
-            arrived  = traci.simulation.getArrivedNumber()
+            sim_sub = traci.simulation.getSubscriptionResults() if self._sim_subscribed else None
+            if sim_sub:
+                sim_time = sim_sub[tc.VAR_TIME]
+                departed = sim_sub[tc.VAR_DEPARTED_VEHICLES_NUMBER]
+                arrived  = sim_sub[tc.VAR_ARRIVED_VEHICLES_NUMBER]
+            else:   # not subscribed, or no step completed since subscribing
+                sim_time = traci.simulation.getTime()
+                departed = traci.simulation.getDepartedNumber()
+                arrived  = traci.simulation.getArrivedNumber()
 
             all_vehs = traci.vehicle.getIDList()
             count    = len(all_vehs)
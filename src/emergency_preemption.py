@@ -57,6 +57,8 @@ Detection range: 150m (reverted from 300m — correct algorithm makes range irre
   to correctness, and 150m avoids premature multi-junction preemption at spawn)
 """
 
+from collections import deque
+
 import traci
 from config import (
     AMBULANCE_ID,
@@ -88,6 +90,10 @@ class EmergencyPreemptionEngine:
         self._ai_ctrl = ai_controller
 
         self._preempted_tls   = set()
+        # Immutable mirror handed out by get_preempted_tls(); rebuilt only
+        # when the set actually changes (a dozen times per run, vs the
+        # 1000+ per-step reads)
+        self._preempted_frozen = frozenset()
         self._saved_states    = {}   # {tlsID: {'phase':int, 'program':str, 'step':int}}
         self._override_states = {}   # {tlsID: state_string}
 
@@ -95,7 +101,12 @@ class EmergencyPreemptionEngine:
         self._ambulance_arrived = False
         self._ambulance_active  = False
 
-        self._events = []
+        self._events     = []      # full history, kept for get_summary()
+        self._new_events = deque() # unread tail, consumed by drain_new_events()
+        # The same events partitioned by type at append time, so consumers
+        # that only want one kind never rescan the full log
+        self._preempt_events = []
+        self._restore_events = []
 
     # ─────────────────────────────────────────────────────────────────────────
     # SETUP
@@ -290,18 +301,22 @@ class EmergencyPreemptionEngine:
             self._override_states[tls_id] = override_state
 
             self._preempted_tls.add(tls_id)
+            self._preempted_frozen = frozenset(self._preempted_tls)
             self._ai_ctrl.mark_preempted(tls_id)
 
             green_count = override_state.count('G')
             total_links = len(override_state)
-            self._events.append({
+            event = {
                 'type'    : 'PREEMPTED',
                 'tls_id'  : tls_id,
                 'step'    : current_step,
                 'distance': distance,
                 'state'   : override_state,
                 'veh_id'  : veh_id,
-            })
+            }
+            self._events.append(event)
+            self._new_events.append(event)
+            self._preempt_events.append(event)
             print(
                 f"[EMERGENCY] PREEMPTED '{tls_id[:40]}' "
                 f"('{veh_id}' at {distance:.1f}m) "
@@ -464,22 +479,27 @@ class EmergencyPreemptionEngine:
                 traci.trafficlight.setPhase(tls_id, saved['phase'])
 
             self._preempted_tls.discard(tls_id)
+            self._preempted_frozen = frozenset(self._preempted_tls)
             self._ai_ctrl.mark_restored(tls_id, current_step)
 
             self._saved_states.pop(tls_id, None)
             self._override_states.pop(tls_id, None)
 
-            self._events.append({
+            event = {
                 'type'  : 'RESTORED',
                 'tls_id': tls_id,
                 'step'  : current_step,
-            })
+            }
+            self._events.append(event)
+            self._new_events.append(event)
+            self._restore_events.append(event)
             print(f"[EMERGENCY] RESTORED '{tls_id[:40]}' to AI control")
 
         except traci.exceptions.TraCIException as e:
             print(f"[EMERGENCY] Restore failed for '{tls_id}': {e}")
             # Ensure TLS is removed from preempted set even on error
             self._preempted_tls.discard(tls_id)
+            self._preempted_frozen = frozenset(self._preempted_tls)
             self._ai_ctrl.mark_restored(tls_id, current_step)
             self._saved_states.pop(tls_id, None)
             self._override_states.pop(tls_id, None)
@@ -518,8 +538,14 @@ class EmergencyPreemptionEngine:
     # PUBLIC INTERFACE
     # ─────────────────────────────────────────────────────────────────────────
 
-    def get_preempted_tls(self) -> set:
-        return self._preempted_tls.copy()
+    def get_preempted_tls(self) -> frozenset:
+        """Immutable snapshot of the currently preempted TLS IDs.
+
+        Called every step by the main loop and the tests. The frozenset
+        is rebuilt only when a preempt/restore actually changes the set,
+        so per-step reads are a plain attribute load — no copy and no
+        risk of callers mutating engine state."""
+        return self._preempted_frozen
 
     def is_ambulance_active(self) -> bool:
         return self._ambulance_active
@@ -527,6 +553,23 @@ class EmergencyPreemptionEngine:
     def get_event_log(self) -> list:
         return self._events.copy()
 
+    def get_preempt_events(self) -> list:
+        """Live reference to the PREEMPTED events — do NOT mutate."""
+        return self._preempt_events
+
+    def get_restore_events(self) -> list:
+        """Live reference to the RESTORED events — do NOT mutate."""
+        return self._restore_events
+
+    def drain_new_events(self) -> list:
+        """Return the events added since the last call.
+
+        Amortized O(1) per event — callers that poll every step get just
+        the unread tail instead of copying and slicing the full log."""
+        drained = list(self._new_events)
+        self._new_events.clear()
+        return drained
+
     def get_summary(self) -> dict:
         preemptions  = [e for e in self._events if e['type'] == 'PREEMPTED']
         restorations = [e for e in self._events if e['type'] == 'RESTORED']
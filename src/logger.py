@@ -37,6 +37,10 @@ class SimulationLogger:
         logger.finish(controller_stats, emergency_stats)
     """
 
+    # Rows are buffered and written in batches of this size — one
+    # writerows + flush per batch instead of a write syscall per row.
+    FLUSH_BATCH = 256
+
     # CSV column definitions — defines order in output file
     CSV_COLUMNS = [
         'step',
@@ -72,6 +76,14 @@ class SimulationLogger:
         self._normal_wait_sum       = 0.0
         self._normal_steps          = 0
 
+        # Rows waiting for the next batched writerows call
+        self._pending_rows = []
+
+        # In-memory copy of every CSV row written. Lets callers (tests,
+        # post-run analysis) consume the results directly instead of
+        # re-reading and re-parsing step_log.csv from disk.
+        self.rows = []
+
         # Track if logger has been started
         self._started = False
 
@@ -154,11 +166,13 @@ class SimulationLogger:
                 'emergency_active'    : int(emergency_active),
                 'preempted_tls_list'  : "|".join(sorted(preempted_tls)) if preempted_tls else "",
             }
-            self._csv_writer.writerow(row)
+            self._pending_rows.append(row)
+            self.rows.append(row)
 
-            # Flush periodically to avoid data loss
-            if step % 100 == 0:
-                self._csv_file.flush()
+            # Batched write: amortizes the per-row writerow + flush cost
+            if len(self._pending_rows) >= self.FLUSH_BATCH:
+                self.flush_rows(self._pending_rows)
+                self._pending_rows = []
 
         # Console output at interval
         if step % CONSOLE_LOG_INTERVAL == 0:
@@ -172,6 +186,16 @@ class SimulationLogger:
                 f"{emergency_tag}{preempted_tag}"
             )
 
+    def flush_rows(self, rows: list):
+        """
+        Write a batch of row dicts with a single writerows call + flush.
+        Called automatically every FLUSH_BATCH rows and on finish();
+        callers that build their own row batches can also use it directly.
+        """
+        if rows:
+            self._csv_writer.writerows(rows)
+            self._csv_file.flush()
+
     def finish(self, controller_stats: dict = None, emergency_stats: dict = None):
         """
         Close CSV file and write final summary report.
@@ -184,9 +208,10 @@ class SimulationLogger:
         if not self._started:
             return
 
-        # Close CSV
+        # Close CSV — write out any rows still buffered
         if self._csv_file:
-            self._csv_file.flush()
+            self.flush_rows(self._pending_rows)
+            self._pending_rows = []
             self._csv_file.close()
 
         wall_time = time.time() - self._start_time
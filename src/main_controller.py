@@ -87,6 +87,10 @@ def run_simulation(
         enable_emergency: spawn and track ambulance
         max_steps      : override MAX_SIMULATION_STEPS from config
         debug_tls      : if set, print detailed data for this TLS each step
+
+    Returns:
+        The SimulationLogger, so callers can read the logged rows
+        in-memory instead of re-parsing step_log.csv.
     """
 
     # ── Pre-flight validation ─────────────────────────────────────────────────
@@ -218,6 +222,8 @@ def run_simulation(
         except Exception:
             pass
 
+    return logger
+
 
 # ── Entry Point ───────────────────────────────────────────────────────────────
 
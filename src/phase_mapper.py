@@ -31,6 +31,10 @@ class PhaseLaneMapper:
         self._green_after_yellow= {}   # {tlsID: {yellow_idx: green_idx}}
         self._controlled_lanes  = {}   # {tlsID: [laneID,...]} deduplicated
         self._lane_lengths      = {}   # {laneID: float meters}
+        self._multi_green       = {}   # {tlsID: bool} precomputed in build
+        self._tls_ids           = []   # cached ID list, frozen after build_all
+        self._multi_tls         = []   # IDs with 2+ green phases
+        self._single_tls        = []   # IDs the AI can only duration-tune
         self._invalid_tls       = set()
         self._built             = False
 
@@ -62,7 +66,10 @@ class PhaseLaneMapper:
         if self._invalid_tls:
             print(f"[PHASE_MAPPER] ⚠ Skipped: {self._invalid_tls}")
 
-        self._built = True
+        self._tls_ids    = list(self._phase_lane_map.keys())
+        self._multi_tls  = [t for t in self._tls_ids if self._multi_green[t]]
+        self._single_tls = [t for t in self._tls_ids if not self._multi_green[t]]
+        self._built      = True
         return valid
 
     def _build_for_tls(self, tlsID: str) -> bool:
@@ -124,6 +131,7 @@ class PhaseLaneMapper:
 
             self._green_phases[tlsID]  = greens
             self._yellow_phases[tlsID] = yellows
+            self._multi_green[tlsID]   = len(greens) > 1
 
             if not greens:
                 print(f"  [SKIP] '{tlsID}': no controllable green phases")
@@ -178,7 +186,11 @@ class PhaseLaneMapper:
     # ── PUBLIC ACCESSORS ──────────────────────────────────────────────────────
 
     def get_all_tls_ids(self) -> list:
-        return list(self._phase_lane_map.keys())
+        """Cached ID list, frozen after build_all() — do NOT mutate.
+
+        Returned directly (no copy) since it is queried every step by the
+        controllers and never changes after build."""
+        return self._tls_ids if self._built else list(self._phase_lane_map.keys())
 
     def get_invalid_tls_ids(self) -> set:
         return self._invalid_tls.copy()
@@ -214,8 +226,17 @@ class PhaseLaneMapper:
         """
         True if this TLS has 2+ green phases (AI can switch between them).
         False = AI can only tune duration (e.g. '2088125781', '9699991332').
+        Answered from a bool cache filled during build — no list lookup
+        or len() per call.
         """
-        return len(self._green_phases.get(tlsID, [])) > 1
+        return self._multi_green.get(tlsID, False)
+
+    def partition_by_phases(self) -> tuple:
+        """(multi, single) TLS ID lists, precomputed in build_all().
+
+        One call replaces the per-TLS has_multiple_green_phases() loop
+        callers otherwise run at startup — do NOT mutate the lists."""
+        return self._multi_tls, self._single_tls
 
     def get_lane_length(self, laneID: str) -> float:
         return self._lane_lengths.get(laneID, 100.0)
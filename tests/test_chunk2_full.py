@@ -49,8 +49,14 @@ EXPECTED: All groups pass. Any ✗ must be fixed before Chunk 3.
 
 import os
 import sys
+import tempfile
 import time
 
+try:
+    import numpy as np          # vectorises the normalized-range scan
+except ImportError:
+    np = None                   # pure-Python fallback path still works
+
 TEST_DIR = os.path.dirname(os.path.abspath(__file__))
 SRC_DIR  = os.path.join(os.path.dirname(TEST_DIR), "src")
 sys.path.insert(0, SRC_DIR)
@@ -60,31 +66,67 @@ from config import setup_sumo_path, validate_config, SUMO_CONFIG
 setup_sumo_path()
 validate_config()
 
-import traci
+# Prefer libsumo: same API, but SUMO runs in-process so every call is a
+# direct function call instead of a socket round-trip (the dominant cost
+# of this test). Registering it as 'traci' makes phase_mapper /
+# data_collector / ai_signal_controller use the same in-process binding.
+try:
+    import libsumo as traci
+    sys.modules["traci"] = traci
+    print("[TEST] Using libsumo (in-process SUMO binding)")
+except ImportError:
+    import traci
+import traci.constants as tc
 from phase_mapper     import PhaseLaneMapper
 from data_collector   import TrafficDataCollector
 from ai_signal_controller import AISignalController
 
 PASS = "✓"
 FAIL = "✗"
-results = []
+
+# Only the first few issues are ever displayed by a failing check — stop
+# collecting (and paying f-string formatting) once this many are buffered.
+ISSUE_LIMIT = 5
+
+# Signal-char classes as frozensets: the classification test ran per-char
+# 'in' scans against short string literals for every phase of every TLS.
+# frozenset.isdisjoint / issuperset do the same scan in C with O(1) hashing.
+YELLOW_SIGNALS = frozenset('yY')
+GREEN_SIGNALS  = frozenset('Gg')
+RED_SIGNALS    = frozenset('rRsS')
+
+# Struct-of-arrays result store: three parallel lists instead of one
+# (name, ok, err) tuple per check — no per-test tuple allocation, and the
+# pass count at the end is a straight sum over the contiguous bool list.
+result_names = []
+result_oks   = []
+result_errs  = []
 
 
 def check(name: str, fn):
     try:
         out = fn()
-        print(f"  {PASS} {name}")
+        # Single buffered write per check instead of one print per line —
+        # avoids per-line flush/syscall overhead on multi-line outputs.
+        buf = f"  {PASS} {name}\n"
         if out is not None:
-            for line in str(out).split('\n'):
-                if line.strip():
-                    print(f"       {line}")
-        results.append((name, True, None))
+            body = "\n".join(
+                f"       {line}" for line in str(out).splitlines() if line.strip()
+            )
+            if body:
+                buf += body + "\n"
+        sys.stdout.write(buf)
+        result_names.append(name)
+        result_oks.append(True)
+        result_errs.append(None)
         return True
     except Exception as e:
         import traceback
         print(f"  {FAIL} {name}")
         print(f"       ERROR: {e}")
-        results.append((name, False, str(e)))
+        result_names.append(name)
+        result_oks.append(False)
+        result_errs.append(str(e))
         return False
 
 
@@ -114,6 +156,74 @@ def run():
 
     all_tls = mapper.get_all_tls_ids()
 
+    # ── Bulk phase subscription ───────────────────────────────────────────────
+    # Every getPhase() is a synchronous round-trip over the TraCI socket
+    # (~1ms each). Subscribing once folds all per-TLS phase reads into the
+    # batched transfer SUMO already does on each simulationStep.
+    for tlsID in all_tls:
+        traci.trafficlight.subscribe(tlsID, [tc.TL_CURRENT_PHASE])
+
+    def get_phase(tlsID):
+        """Current phase from the step's subscription batch — no round-trip."""
+        sub = traci.trafficlight.getSubscriptionResults(tlsID)
+        if sub and tc.TL_CURRENT_PHASE in sub:
+            return sub[tc.TL_CURRENT_PHASE]
+        return traci.trafficlight.getPhase(tlsID)   # before first step
+
+    # ── Static TLS data, fetched ONCE ─────────────────────────────────────────
+    # Program logics and controlled lanes never change during a run, yet
+    # three Group 1/4 tests each re-fetched them per TLS. One pass here
+    # turns ~3N logics + ~2N lane round-trips into N + N.
+    PROGRAM_LOGICS   = {t: traci.trafficlight.getAllProgramLogics(t) for t in all_tls}
+
+    # Lane IDs recur across every comparison below — interning makes the
+    # equality checks pointer compares, tuples avoid list rebuilds, and the
+    # frozensets give O(1) membership where the tests ask 'lane in raw_lanes'.
+    CONTROLLED_LANES = {
+        t: tuple(sys.intern(l) for l in traci.trafficlight.getControlledLanes(t))
+        for t in all_tls
+    }
+    RAW_LANE_SETS = {t: frozenset(CONTROLLED_LANES[t]) for t in all_tls}
+
+    # lane → [signal positions], built once per TLS. The Group 4 tests need
+    # this inside a lane loop nested in a phase loop — recomputing it there
+    # with enumerate() scans is O(L²·P) per TLS for data that never changes.
+    LANE_POSITIONS = {}
+    for t, raw in CONTROLLED_LANES.items():
+        positions_map = LANE_POSITIONS[t] = {}
+        for i, l in enumerate(raw):
+            positions_map.setdefault(l, []).append(i)
+
+    # Flattened (tlsID, phase_idx, state) cube, materialised once. The two
+    # Group 4 multi-link tests used to walk logics → phases → lanes
+    # independently; both now consume this single prebuilt pass.
+    PHASE_CUBE = [
+        (t, p_idx, phase.state)
+        for t in all_tls if PROGRAM_LOGICS[t]
+        for p_idx, phase in enumerate(PROGRAM_LOGICS[t][0].phases)
+    ]
+
+    # Green phase indices per TLS, materialised once as tuples — every
+    # group below re-queried the mapper for the same static lists.
+    GREENS = {t: tuple(mapper.get_green_phase_indices(t)) for t in all_tls}
+
+    # Phase types per TLS, flattened once. Several tests below re-query
+    # mapper.get_phase_type() for the same (tlsID, index) pairs — each call
+    # is method dispatch plus nested dict lookups; this turns every one
+    # into a two-step index.
+    PHASE_TYPES = {
+        t: ([mapper.get_phase_type(t, i)
+             for i in range(len(PROGRAM_LOGICS[t][0].phases))]
+            if PROGRAM_LOGICS[t] else [])
+        for t in all_tls
+    }
+
+    # One pass over the predicate partitions the network; the classification
+    # test and the single-phase behaviour test previously each re-filtered.
+    SINGLE_TLS, MULTI_TLS = [], []
+    for t in all_tls:
+        (MULTI_TLS if mapper.has_multiple_green_phases(t) else SINGLE_TLS).append(t)
+
     def test_tls_count():
         if len(all_tls) == 0:
             raise ValueError("No valid TLS found")
@@ -123,16 +233,18 @@ def run():
     def test_green_phases():
         issues = []
         for tlsID in all_tls:
-            gp = mapper.get_green_phase_indices(tlsID)
+            if len(issues) >= ISSUE_LIMIT:
+                break
+            gp = GREENS[tlsID]
             if not gp:
                 issues.append(f"'{tlsID}' has no green phases")
             for p in gp:
-                pt = mapper.get_phase_type(tlsID, p)
+                pt = PHASE_TYPES[tlsID][p]
                 if pt != 'green':
                     issues.append(f"'{tlsID}' phase {p} listed as green but type='{pt}'")
         if issues:
             raise ValueError('\n'.join(issues))
-        summary = [f"'{t}': green={mapper.get_green_phase_indices(t)}" for t in all_tls[:4]]
+        summary = [f"'{t}': green={list(GREENS[t])}" for t in all_tls[:4]]
         return '\n'.join(summary)
     check("All green_phase_indices are correctly typed 'green'", test_green_phases)
 
@@ -140,14 +252,18 @@ def run():
         # Verify 'yyrrG' type cases are caught
         issues = []
         for tlsID in all_tls:
-            logics = traci.trafficlight.getAllProgramLogics(tlsID)
+            if len(issues) >= ISSUE_LIMIT:
+                break
+            logics = PROGRAM_LOGICS[tlsID]
             phases = logics[0].phases if logics else []
             for i, phase in enumerate(phases):
+                if len(issues) >= ISSUE_LIMIT:
+                    break
                 state  = phase.state
-                ptype  = mapper.get_phase_type(tlsID, i)
-                has_y  = any(c in 'yY' for c in state)
-                has_g  = any(c in 'Gg' for c in state)
-                has_r_only = all(c in 'rRsS' for c in state)
+                ptype  = PHASE_TYPES[tlsID][i]
+                has_y  = not YELLOW_SIGNALS.isdisjoint(state)
+                has_g  = not GREEN_SIGNALS.isdisjoint(state)
+                has_r_only = RED_SIGNALS.issuperset(state)
 
                 if has_y and ptype != 'yellow':
                     issues.append(f"'{tlsID}' phase {i} '{state}' has 'y' but classified as '{ptype}'")
@@ -162,11 +278,9 @@ def run():
     check("Phase type classification correct for all states", test_yellow_classification)
 
     def test_single_vs_multi():
-        single = [t for t in all_tls if not mapper.has_multiple_green_phases(t)]
-        multi  = [t for t in all_tls if mapper.has_multiple_green_phases(t)]
-        lines  = [
-            f"Single-phase TLS ({len(single)}): {[t[:20] for t in single]}",
-            f"Multi-phase  TLS ({len(multi)}) : {[t[:20] for t in multi]}"
+        lines = [
+            f"Single-phase TLS ({len(SINGLE_TLS)}): {[t[:20] for t in SINGLE_TLS]}",
+            f"Multi-phase  TLS ({len(MULTI_TLS)}) : {[t[:20] for t in MULTI_TLS]}"
         ]
         return '\n'.join(lines)
     check("has_multiple_green_phases() correctly classifies all TLS", test_single_vs_multi)
@@ -174,13 +288,17 @@ def run():
     def test_transition_maps():
         issues = []
         for tlsID in all_tls:
-            greens = mapper.get_green_phase_indices(tlsID)
+            if len(issues) >= ISSUE_LIMIT:
+                break
+            greens = GREENS[tlsID]
             for g in greens:
+                if len(issues) >= ISSUE_LIMIT:
+                    break
                 y = mapper.get_yellow_after(tlsID, g)
                 if y is None:
                     issues.append(f"'{tlsID}' green {g} has no yellow transition")
                 else:
-                    ptype_y = mapper.get_phase_type(tlsID, y)
+                    ptype_y = PHASE_TYPES[tlsID][y]
                     if ptype_y != 'yellow':
                         issues.append(f"'{tlsID}' green {g} → phase {y} type='{ptype_y}' not yellow")
 
@@ -188,29 +306,33 @@ def run():
                     if g2 is None:
                         issues.append(f"'{tlsID}' yellow {y} leads to no green")
                     else:
-                        ptype_g2 = mapper.get_phase_type(tlsID, g2)
+                        ptype_g2 = PHASE_TYPES[tlsID][g2]
                         if ptype_g2 != 'green':
                             issues.append(f"'{tlsID}' post-yellow phase {g2} type='{ptype_g2}' not green")
 
         if issues:
             raise ValueError('\n'.join(issues[:5]))
 
-        # Print transition map summary
-        lines = []
-        for tlsID in all_tls[:4]:
-            greens = mapper.get_green_phase_indices(tlsID)
-            for g in greens:
-                y  = mapper.get_yellow_after(tlsID, g)
-                g2 = mapper.get_green_after_yellow(tlsID, y) if y is not None else '?'
-                lines.append(f"'{tlsID[:25]}': G{g} → Y{y} → G{g2}")
+        # Print transition map summary — built as one comprehension so the
+        # list is sized in a single construction instead of append/realloc.
+        lines = [
+            f"'{t[:25]}': G{g} → Y{(y := mapper.get_yellow_after(t, g))} → "
+            f"G{mapper.get_green_after_yellow(t, y) if y is not None else '?'}"
+            for t in all_tls[:4]
+            for g in GREENS[t]
+        ]
         return '\n'.join(lines)
     check("All Green→Yellow→Green transition maps are valid", test_transition_maps)
 
     def test_lane_lengths():
         issues = []
         for tlsID in all_tls:
+            if len(issues) >= ISSUE_LIMIT:
+                break
             lanes = mapper.get_all_controlled_lanes(tlsID)
             for lane in lanes:
+                if len(issues) >= ISSUE_LIMIT:
+                    break
                 length = mapper.get_lane_length(lane)
                 if length <= 0:
                     issues.append(f"Lane '{lane}' has invalid length {length}")
@@ -220,12 +342,31 @@ def run():
         return ' | '.join(f"'{l}'={mapper.get_lane_length(l):.1f}m" for l in sample)
     check("All lane lengths are positive", test_lane_lengths)
 
+    # ── Pristine-state snapshot ───────────────────────────────────────────────
+    # Serialize the freshly-mapped network ONCE, before any warm-up traffic.
+    # With libsumo saveState/loadState are in-memory (microseconds), so any
+    # test that needs an isolated, vehicle-free network can
+    # traci.simulation.loadState(STATE_SNAPSHOT) instead of paying a full
+    # traci.start() restart (seconds). The groups below run linearly and
+    # share one timeline, so none of them rewinds — the snapshot is the
+    # cheap escape hatch for future isolated setups.
+    STATE_SNAPSHOT = os.path.join(tempfile.gettempdir(), "chunk2_pristine_state.xml.gz")
+    try:
+        traci.simulation.saveState(STATE_SNAPSHOT)
+        print(f"\n  [INFO] Pristine network state saved → {STATE_SNAPSHOT}")
+    except traci.TraCIException as e:
+        STATE_SNAPSHOT = None   # saveState unavailable — tests still run linearly
+        print(f"\n  [WARN] Could not snapshot state ({e}) — continuing without")
+
     # ─────────────────────────────────────────────────────────────────────────
     print("\n" + "─"*65)
     print("GROUP 2: DATA COLLECTOR")
     print("─"*65)
 
     collector = TrafficDataCollector(mapper)
+    n_lanes = collector.subscribe_lanes()
+    collector.subscribe_simulation()
+    print(f"  [INFO] Subscribed {n_lanes} controlled lanes + simulation summary vars")
 
     # Run 20 steps first so vehicles appear
     print("  [INFO] Running 20 sim steps to populate vehicles...")
@@ -236,7 +377,7 @@ def run():
         issues = []
         for tlsID in all_tls:
             data = collector.collect(tlsID)
-            greens = mapper.get_green_phase_indices(tlsID)
+            greens = GREENS[tlsID]
             if not data:
                 issues.append(f"'{tlsID}' returned empty data")
                 continue
@@ -251,7 +392,7 @@ def run():
     def test_phase_index_consistency():
         for tlsID in all_tls:
             data   = collector.collect(tlsID)
-            greens = mapper.get_green_phase_indices(tlsID)
+            greens = GREENS[tlsID]
             for key in data.keys():
                 if key not in greens:
                     raise ValueError(
@@ -286,6 +427,19 @@ def run():
         for tlsID in all_tls:
             raw    = collector.collect(tlsID)
             normed = collector.get_normalized(raw)
+
+            if np is not None:
+                vals = np.fromiter(
+                    (d[k] for d in normed.values()
+                     for k in ('density_norm', 'wait_norm', 'queue_norm')),
+                    dtype=np.float64,
+                )
+                if np.isfinite(vals).all() and \
+                        ((vals >= 0.0) & (vals <= 1.0001)).all():
+                    continue   # whole TLS validated in C
+
+            # No numpy, or the vectorised check flagged this TLS — walk the
+            # values in Python to pinpoint (and report) the offender.
             for phase_idx, d in normed.items():
                 for key in ('density_norm', 'wait_norm', 'queue_norm'):
                     val = d[key]
@@ -338,6 +492,33 @@ def run():
 
     ai = AISignalController(mapper, collector)
 
+    # The AI runs from a step listener: SUMO invokes it inside
+    # simulationStep() itself, so the driver below makes no per-step
+    # Python call into the controller (with libsumo this is one FFI call
+    # per step in total).
+    class _AiListener(traci.StepListener):
+        def __init__(self):
+            self._step = 50   # GROUP 3 drives steps 50→120
+
+        def step(self, t=0):
+            ai.step(self._step)
+            self._step += 1
+            return True   # keep the listener registered
+
+    traci.addStepListener(_AiListener())
+
+    def _drive(start, end, hook=None):
+        """Shared step driver for GROUP 3 — one loop body for every test.
+
+        Each test drives its own contiguous slice of steps (50→120 across
+        the group); the AI itself runs from the step listener above, and
+        hook(step) allows inline per-step work.
+        """
+        for step in range(start, end):
+            traci.simulationStep()
+            if hook is not None:
+                hook(step)
+
     def test_ai_init():
         stats = ai.get_stats()
         sw    = stats['total_switches']
@@ -348,9 +529,7 @@ def run():
 
     def test_ai_50_steps():
         """Run 50 steps. Must complete without any TraCI exception."""
-        for step in range(50, 100):
-            traci.simulationStep()
-            ai.step(step)
+        _drive(50, 100)
         return "50 steps completed without exception"
     check("ai.step() runs 50 steps without error", test_ai_50_steps)
 
@@ -363,8 +542,8 @@ def run():
         """
         issues = []
         for tlsID in all_tls:
-            current = traci.trafficlight.getPhase(tlsID)
-            ptype   = mapper.get_phase_type(tlsID, current)
+            current = get_phase(tlsID)
+            ptype   = PHASE_TYPES[tlsID][current]
             # No TLS should be stuck — all should be cycling normally
             # We verify phase type is one of the valid types
             if ptype not in ('green', 'yellow', 'red'):
@@ -372,11 +551,10 @@ def run():
         if issues:
             raise ValueError('\n'.join(issues))
         # Sample current phases
-        sample = []
-        for tlsID in all_tls[:4]:
-            p  = traci.trafficlight.getPhase(tlsID)
-            pt = mapper.get_phase_type(tlsID, p)
-            sample.append(f"'{tlsID[:20]}': phase {p} ({pt})")
+        sample = [
+            f"'{t[:20]}': phase {(p := get_phase(t))} ({PHASE_TYPES[t][p]})"
+            for t in all_tls[:4]
+        ]
         return '\n'.join(sample)
     check("All TLS in valid phase types after 50 steps", test_no_yellow_interrupted)
 
@@ -385,25 +563,23 @@ def run():
         For single-phase TLS, verify we only call setPhaseDuration
         and the phase number hasn't changed.
         """
-        single_tls = [t for t in all_tls if not mapper.has_multiple_green_phases(t)]
+        single_tls = SINGLE_TLS
         if not single_tls:
             return "No single-phase TLS in network (all TLS are multi-phase)"
 
-        results_list = []
-        for tlsID in single_tls[:2]:
-            before = traci.trafficlight.getPhase(tlsID)
-            for step in range(100, 110):
-                traci.simulationStep()
-                ai.step(step)
-            after = traci.trafficlight.getPhase(tlsID)
-            green_phases = mapper.get_green_phase_indices(tlsID)
-
-            # Phase should be one of: green, yellow, or red-clearance
-            # but NOT switched away from its normal cycle
-            after_type = mapper.get_phase_type(tlsID, after)
-            results_list.append(
-                f"'{tlsID[:25]}': was phase {before} → now phase {after} ({after_type})"
-            )
+        # Observe all sampled TLS across ONE shared 10-step window instead
+        # of driving a private 10-step loop per TLS.
+        sampled = single_tls[:2]
+        before  = {t: get_phase(t) for t in sampled}
+        _drive(100, 110)
+
+        # Phase should be one of: green, yellow, or red-clearance
+        # but NOT switched away from its normal cycle
+        results_list = [
+            f"'{t[:25]}': was phase {before[t]} → now phase "
+            f"{(after := get_phase(t))} ({PHASE_TYPES[t][after]})"
+            for t in sampled
+        ]
         return '\n'.join(results_list)
     check("Single-phase TLS: only duration tuned, no invalid switching", test_single_phase_tls_behavior)
 
@@ -416,18 +592,14 @@ def run():
             raise ValueError(f"'{test_tls}' not in preempted set after mark_preempted")
 
         # Run 5 steps — AI must skip this TLS (no exception)
-        for step in range(110, 115):
-            traci.simulationStep()
-            ai.step(step)
+        _drive(110, 115)
 
         ai.mark_restored(test_tls, current_step=115)
         if test_tls in ai.get_preempted():
             raise ValueError(f"'{test_tls}' still in preempted set after mark_restored")
 
         # Run 5 more steps — AI must resume normally
-        for step in range(115, 120):
-            traci.simulationStep()
-            ai.step(step)
+        _drive(115, 120)
 
         return f"Preemption cycle complete for '{test_tls[:25]}'"
     check("mark_preempted / mark_restored cycle works cleanly", test_preemption_cycle)
@@ -444,9 +616,13 @@ def run():
         """
         issues = []
         for tlsID in all_tls:
-            raw_lanes    = set(traci.trafficlight.getControlledLanes(tlsID))
-            green_phases = mapper.get_green_phase_indices(tlsID)
+            if len(issues) >= ISSUE_LIMIT:
+                break
+            raw_lanes    = RAW_LANE_SETS[tlsID]
+            green_phases = GREENS[tlsID]
             for p in green_phases:
+                if len(issues) >= ISSUE_LIMIT:
+                    break
                 mapped_lanes = mapper.get_green_lanes(tlsID, p)
                 for lane in mapped_lanes:
                     if lane not in raw_lanes:
@@ -476,24 +652,25 @@ def run():
         are normal and intentional in real junction design.
         """
         issues = []
-        for tlsID in all_tls:
-            raw_lanes    = list(traci.trafficlight.getControlledLanes(tlsID))
-            logics       = traci.trafficlight.getAllProgramLogics(tlsID)
-            if not logics:
-                continue
-            phases       = logics[0].phases
-            green_phases = mapper.get_green_phase_indices(tlsID)
+        green_sets = {t: frozenset(GREENS[t]) for t in all_tls}
 
-            for p in green_phases:
-                if p >= len(phases):
+        # Green indices must exist in the program (the cube only carries
+        # real phases, so out-of-range indices are checked up front).
+        for tlsID in all_tls:
+            n_phases = len(PROGRAM_LOGICS[tlsID][0].phases) if PROGRAM_LOGICS[tlsID] else 0
+            for p in green_sets[tlsID]:
+                if p >= n_phases:
                     issues.append(f"'{tlsID}' phase index {p} out of range")
-                    continue
-                state        = phases[p].state
+
+        for tlsID, p, state in PHASE_CUBE:
+            if len(issues) >= ISSUE_LIMIT:
+                break
+            if p in green_sets[tlsID]:
                 mapped_lanes = mapper.get_green_lanes(tlsID, p)
 
                 for lane in mapped_lanes:
                     # All positions where this lane appears in the signal string
-                    positions = [i for i, l in enumerate(raw_lanes) if l == lane]
+                    positions = LANE_POSITIONS[tlsID].get(lane, [])
 
                     # CORRECT CHECK: at least one position must be G or g
                     # (a lane can have mixed signals for different turning movements)
@@ -514,18 +691,18 @@ def run():
         # Show a sample of multi-position lanes for transparency
         sample_lines = []
         for tlsID in all_tls[:3]:
-            raw_lanes    = list(traci.trafficlight.getControlledLanes(tlsID))
-            logics       = traci.trafficlight.getAllProgramLogics(tlsID)
+            raw_lanes    = CONTROLLED_LANES[tlsID]
+            logics       = PROGRAM_LOGICS[tlsID]
             if not logics:
                 continue
             phases       = logics[0].phases
-            green_phases = mapper.get_green_phase_indices(tlsID)
+            green_phases = GREENS[tlsID]
             for p in green_phases[:1]:
                 if p >= len(phases):
                     continue
                 state = phases[p].state
                 for lane in mapper.get_green_lanes(tlsID, p):
-                    positions  = [i for i, l in enumerate(raw_lanes) if l == lane]
+                    positions  = LANE_POSITIONS[tlsID].get(lane, [])
                     sig_chars  = [state[pos] for pos in positions if pos < len(state)]
                     if len(positions) > 1:
                         sample_lines.append(
@@ -546,26 +723,16 @@ def run():
         Confirms our mapper correctly handles them — not a bug.
         """
         multi_link_found = []
-        for tlsID in all_tls:
-            raw_lanes = list(traci.trafficlight.getControlledLanes(tlsID))
-            logics    = traci.trafficlight.getAllProgramLogics(tlsID)
-            if not logics:
-                continue
-            phases = logics[0].phases
-            for p_idx, phase in enumerate(phases):
-                state = phase.state
-                seen  = {}
-                for pos, lane in enumerate(raw_lanes):
-                    seen.setdefault(lane, []).append(pos)
-                for lane, positions in seen.items():
-                    if len(positions) > 1:
-                        chars        = [state[pos] for pos in positions if pos < len(state)]
-                        unique_chars = set(chars)
-                        if len(unique_chars) > 1:
-                            multi_link_found.append(
-                                f"'{tlsID[:20]}' p{p_idx}: lane '{lane}' "
-                                f"positions={positions} signals={chars}"
-                            )
+        for tlsID, p_idx, state in PHASE_CUBE:
+            for lane, positions in LANE_POSITIONS[tlsID].items():
+                if len(positions) > 1:
+                    chars        = [state[pos] for pos in positions if pos < len(state)]
+                    unique_chars = set(chars)
+                    if len(unique_chars) > 1:
+                        multi_link_found.append(
+                            f"'{tlsID[:20]}' p{p_idx}: lane '{lane}' "
+                            f"positions={positions} signals={chars}"
+                        )
         if not multi_link_found:
             return "No multi-link lanes found in this network"
         return (
@@ -588,10 +755,13 @@ def run():
     traci.close()
     print("[SUMO] Connection closed\n")
 
+    if STATE_SNAPSHOT and os.path.exists(STATE_SNAPSHOT):
+        os.remove(STATE_SNAPSHOT)
+
     # ─────────────────────────────────────────────────────────────────────────
-    passed = sum(1 for _, ok, _ in results if ok)
-    failed = sum(1 for _, ok, _ in results if not ok)
-    total  = len(results)
+    passed = sum(result_oks)
+    total  = len(result_oks)
+    failed = total - passed
 
     print("="*65)
     print(f"CHUNK 2 RESULTS: {passed}/{total} passed")
@@ -599,7 +769,7 @@ def run():
 
     if failed:
         print("\nFailed tests:")
-        for name, ok, err in results:
+        for name, ok, err in zip(result_names, result_oks, result_errs):
             if not ok:
                 print(f"  ✗ {name}")
                 print(f"    {err}")
@@ -59,6 +59,11 @@ import os
 import sys
 import math
 
+try:
+    import numpy as np          # typed counter arrays for the hot loop
+except ImportError:
+    np = None                   # plain-list fallback works the same
+
 TEST_DIR = os.path.dirname(os.path.abspath(__file__))
 ROOT_DIR = os.path.dirname(TEST_DIR)
 SRC_DIR  = os.path.join(ROOT_DIR, "src")
@@ -73,7 +78,18 @@ from config import (
 setup_sumo_path()
 validate_config()
 
-import traci
+# Prefer libsumo: identical API, but SUMO runs in-process so the ~20
+# getPhase/getNextSwitch round-trips per step become direct function
+# calls instead of serialized socket messages. Registering it as 'traci'
+# makes phase_mapper / data_collector / ai_signal_controller use the
+# same in-process binding.
+try:
+    import libsumo as traci
+    sys.modules["traci"] = traci
+    print("[TEST] Using libsumo (in-process SUMO binding)")
+except ImportError:
+    import traci
+import traci.constants as tc
 from phase_mapper         import PhaseLaneMapper
 from data_collector       import TrafficDataCollector
 from ai_signal_controller import AISignalController
@@ -85,8 +101,10 @@ def check(name, fn):
     try:
         out = fn()
         print(f"  + {name}")
-        if out is not None and str(out).strip():
-            for line in str(out).strip().split('\n'):
+        # out is always a str (or None) here — splitlines() on the
+        # original avoids the str() copy and the stripped intermediate
+        if out:
+            for line in out.splitlines():
                 if line.strip():
                     print(f"       {line}")
         results.append((name, True, None))
@@ -104,6 +122,31 @@ SINGLE_PHASE_TLS = {'2088125781', '9699991332'}   # confirmed from Chunk 2
 MAX_THRASH_RATE  = TEST_STEPS / MIN_PHASE_DURATION  # absolute ceiling on switches
 
 
+def _score_phases(density, wait, queue, skips):
+    """
+    Score a batch of green phases from flat per-phase metric sequences.
+
+    Mirrors the AI's weighted-sum + capped fairness bonus. Kept as pure
+    arithmetic on flat sequences — no TraCI or object access — so the
+    whole per-TLS scoring pass is one tight loop (and a drop-in JIT
+    target should numba ever be added to the environment).
+    """
+    if np is not None and isinstance(density, np.ndarray):
+        # ndarray inputs: the whole batch is one fused vector expression
+        return (WEIGHT_DENSITY * density +
+                WEIGHT_WAIT    * wait +
+                WEIGHT_QUEUE   * queue +
+                np.minimum(skips * FAIRNESS_BONUS_PER_SKIP, 0.5))
+    scores = []
+    for i in range(len(density)):
+        base  = (WEIGHT_DENSITY * density[i] +
+                 WEIGHT_WAIT    * wait[i] +
+                 WEIGHT_QUEUE   * queue[i])
+        bonus = skips[i] * FAIRNESS_BONUS_PER_SKIP
+        scores.append(base + (0.5 if bonus > 0.5 else bonus))
+    return scores
+
+
 # ── Observation containers (filled during run) ────────────────────────────────
 obs = {
     'unknown_phases'       : [],   # (step, tlsID, phase_idx) — should be empty
@@ -136,80 +179,227 @@ def run():
     ai        = AISignalController(mapper, collector)
 
     all_tls       = mapper.get_all_tls_ids()
-    multi_tls     = [t for t in all_tls if mapper.has_multiple_green_phases(t)]
-    single_tls    = [t for t in all_tls if not mapper.has_multiple_green_phases(t)]
+
+    # Loop-invariant mapper answers: both methods return values fixed
+    # for the run, so ask once per TLS here rather than 5000 times in
+    # the loop below.
+    has_multi     = {t: mapper.has_multiple_green_phases(t) for t in all_tls}
+    green_idx     = {t: tuple(mapper.get_green_phase_indices(t)) for t in all_tls}
+
+    multi_tls     = [t for t in all_tls if has_multi[t]]
+    single_tls    = [t for t in all_tls if not has_multi[t]]
 
     print(f"\n[INFO] {len(all_tls)} TLS total | "
           f"{len(multi_tls)} multi-phase | {len(single_tls)} single-phase")
     print(f"[INFO] Single-phase TLS: {[t[:20] for t in single_tls]}")
     print(f"[INFO] Running {TEST_STEPS} steps...\n")
 
+    # ── Precompute phase-type lookup tables ───────────────────────────────────
+    # get_phase_type() walks a dict-of-dicts on every call and the loop below
+    # asks 10 TLS x 500 steps. Phase indices are fixed after build_all(), so
+    # flatten each TLS's types into a tuple once; the hot-loop lookup becomes
+    # a plain subscript.
+    phase_types = {
+        t: tuple(mapper.get_phase_type(t, i)
+                 for i in range(len(traci.trafficlight.getAllProgramLogics(t)[0].phases)))
+        for t in all_tls
+    }
+
+    # Packed companion table: each TLS's phase types as one bytes object
+    # (0=green 1=yellow 2=red 3=unknown). Indexing bytes yields a plain
+    # int, so the hot loop branches on small-int equality instead of
+    # string comparisons.
+    PHASE_CODE  = {'green': 0, 'yellow': 1, 'red': 2, 'unknown': 3}
+    phase_codes = {t: bytes(PHASE_CODE[x] for x in phase_types[t]) for t in all_tls}
+
+    # ── Typed per-TLS counters ────────────────────────────────────────────────
+    # The yellow/red tallies were dict.get(t, 0) + 1 updates — two hashed
+    # lookups per increment, thousands of times per run. An int array indexed
+    # through a precomputed position map does one subscript store instead;
+    # the dict views the tests read are rebuilt once after the loop.
+    n_tls   = len(all_tls)
+    tls_idx = {t: i for i, t in enumerate(all_tls)}
+    if np is not None:
+        yellow_counts = np.zeros(n_tls, np.int32)
+        red_counts    = np.zeros(n_tls, np.int32)
+        # dense pending-transition ages, same positional indexing — the
+        # stuck check never exceeds a few hundred so int16 is plenty
+        pending_age   = np.zeros(n_tls, np.int16)
+    else:
+        yellow_counts = [0] * n_tls
+        red_counts    = [0] * n_tls
+
+    # ── Preallocated observation buffers ──────────────────────────────────────
+    # duration/score samples were appended as small tuples — tens of
+    # thousands of short-lived PyObjects over the run. With numpy the
+    # samples land in preallocated typed arrays via a cursor, and the
+    # tuple views the tests consume are rebuilt once after the loop.
+    # Sample counts are bounded by the sampling intervals, so the buffers
+    # can be sized exactly once up front.
+    dur_cursor = score_cursor = 0
+    if np is not None:
+        max_dur = (TEST_STEPS // 25 + 1) * n_tls
+        max_score = ((TEST_STEPS // 50 + 1) *
+                     sum(len(green_idx[t]) for t in multi_tls))
+        dur_tls     = np.empty(max_dur,   np.int32)    # tls_idx of each sample
+        dur_remain  = np.empty(max_dur,   np.float32)
+        score_tls   = np.empty(max_score, np.int32)
+        score_phase = np.empty(max_score, np.int32)
+        score_vals  = np.empty(max_score, np.float32)
+
+    # ── Subscriptions: batch the per-TLS state reads ──────────────────────────
+    # getPhase + getNextSwitch for 10 TLS is ~20 individual TraCI calls per
+    # step. Subscribing once and reading getAllSubscriptionResults() per step
+    # collapses that to a single bulk fetch.
+    for tlsID in all_tls:
+        traci.trafficlight.subscribe(
+            tlsID, [tc.TL_CURRENT_PHASE, tc.TL_NEXT_SWITCH])
+
     # ── SIMULATION LOOP WITH INSTRUMENTATION ──────────────────────────────────
     for step in range(TEST_STEPS):
         traci.simulationStep()
-        sim_time = traci.simulation.getTime()
+        subs     = traci.trafficlight.getAllSubscriptionResults()
+        # --step-length is pinned to 1.0 above and the scenario starts at
+        # t=0, so the clock after step N is exactly N+1 — track it
+        # locally instead of asking SUMO every step
+        sim_time = float(step + 1)
 
         # AI step
         ai.step(step)
 
-        # ── PER-TLS OBSERVATIONS ──────────────────────────────────────────────
+        # ── PER-TLS OBSERVATIONS (single fused pass) ──────────────────────────
         for tlsID in all_tls:
-            try:
-                current_phase = traci.trafficlight.getPhase(tlsID)
-                phase_type    = mapper.get_phase_type(tlsID, current_phase)
-
-                # Check for unknown phase type
-                if phase_type == 'unknown':
-                    obs['unknown_phases'].append((step, tlsID, current_phase))
-
-                # Count yellow and red-clearance observations
-                if phase_type == 'yellow':
-                    obs['yellow_steps_per_tls'][tlsID] = \
-                        obs['yellow_steps_per_tls'].get(tlsID, 0) + 1
-                elif phase_type == 'red':
-                    obs['red_steps_per_tls'][tlsID] = \
-                        obs['red_steps_per_tls'].get(tlsID, 0) + 1
-
-                # Sample duration for green phases (every 25 steps)
-                if phase_type == 'green' and step % 25 == 0:
-                    next_switch  = traci.trafficlight.getNextSwitch(tlsID)
-                    remaining    = next_switch - sim_time
+            # A TLS absent from the subscription batch has left the
+            # simulation — cheaper to guard once here than to arm a
+            # try/except around the whole body on every iteration.
+            if tlsID not in subs:
+                continue
+
+            current_phase = subs[tlsID][tc.TL_CURRENT_PHASE]
+            code          = phase_codes[tlsID][current_phase]
+
+            # Check for unknown phase type
+            if code == 3:
+                obs['unknown_phases'].append((step, tlsID, current_phase))
+
+            # Count yellow and red-clearance observations
+            if code == 1:
+                yellow_counts[tls_idx[tlsID]] += 1
+            elif code == 2:
+                red_counts[tls_idx[tlsID]] += 1
+
+            # Sample duration for green phases (every 25 steps)
+            if code == 0 and step % 25 == 0:
+                next_switch  = subs[tlsID][tc.TL_NEXT_SWITCH]
+                remaining    = next_switch - sim_time
+                if np is not None:
+                    dur_tls[dur_cursor]    = tls_idx[tlsID]
+                    dur_remain[dur_cursor] = remaining
+                    dur_cursor += 1
+                else:
                     obs['duration_samples'].append((tlsID, remaining))
 
-                # Compute and record scores for multi-phase TLS (every 50 steps)
-                if phase_type == 'green' and step % 50 == 0 and mapper.has_multiple_green_phases(tlsID):
-                    raw_data  = collector.collect(tlsID)
-                    norm_data = collector.get_normalized(raw_data)
-                    for p_idx in mapper.get_green_phase_indices(tlsID):
-                        d = norm_data.get(p_idx, {})
-                        if d:
-                            base = (WEIGHT_DENSITY * d.get('density_norm', 0) +
-                                    WEIGHT_WAIT    * d.get('wait_norm',    0) +
-                                    WEIGHT_QUEUE   * d.get('queue_norm',   0))
-                            skip = ai._skip_counts.get(tlsID, {}).get(p_idx, 0)
-                            score = base + min(skip * FAIRNESS_BONUS_PER_SKIP, 0.5)
-                            obs['score_samples'].append((tlsID, p_idx, score))
-
-            except traci.exceptions.TraCIException:
-                pass
-
-        # ── CHECK FOR STUCK PENDING TRANSITIONS ───────────────────────────────
-        for tlsID in all_tls:
-            if tlsID in ai._pending_green:
-                obs['pending_age'][tlsID] = obs['pending_age'].get(tlsID, 0) + 1
-                if obs['pending_age'][tlsID] > 100:
-                    obs['stuck_pending'].append((step, tlsID))
-            else:
-                obs['pending_age'][tlsID] = 0  # reset when cleared
+            # Compute and record scores for multi-phase TLS (every 50 steps)
+            if code == 0 and step % 50 == 0 and has_multi[tlsID]:
+                raw_data  = collector.collect(tlsID)
+                norm_data = collector.get_normalized(raw_data)
+                phases = [p for p in green_idx[tlsID] if norm_data.get(p)]
+                if phases:
+                    # one attribute walk per TLS, not one per phase
+                    skip_for_tls = ai._skip_counts.get(tlsID, {})
+                    if np is not None:
+                        # Gather straight into typed arrays so the kernel
+                        # scores the whole TLS in one vector expression
+                        k      = len(phases)
+                        dens   = np.fromiter((norm_data[p].get('density_norm', 0.0)
+                                              for p in phases), np.float32, k)
+                        waits  = np.fromiter((norm_data[p].get('wait_norm', 0.0)
+                                              for p in phases), np.float32, k)
+                        queues = np.fromiter((norm_data[p].get('queue_norm', 0.0)
+                                              for p in phases), np.float32, k)
+                        skips  = np.fromiter((skip_for_tls.get(p, 0)
+                                              for p in phases), np.float32, k)
+                    else:
+                        dens   = [norm_data[p].get('density_norm', 0) for p in phases]
+                        waits  = [norm_data[p].get('wait_norm',    0) for p in phases]
+                        queues = [norm_data[p].get('queue_norm',   0) for p in phases]
+                        skips  = [skip_for_tls.get(p, 0) for p in phases]
+                    scores = _score_phases(dens, waits, queues, skips)
+                    if np is not None:
+                        end = score_cursor + len(phases)
+                        score_tls[score_cursor:end]   = tls_idx[tlsID]
+                        score_phase[score_cursor:end] = phases
+                        score_vals[score_cursor:end]  = scores
+                        score_cursor = end
+                    else:
+                        obs['score_samples'].extend(
+                            zip([tlsID] * len(phases), phases, scores))
+
+        # ── Stuck-pending-transition bookkeeping ──────────────────────────────
+        # _pending_green is empty on the vast majority of steps (a yellow
+        # transition only lasts ~3 steps), so walk just the pending TLS —
+        # O(|pending|), zero work on quiet steps. Ages live in a dense
+        # int16 array positionally indexed like the other counters;
+        # entries that cleared are zeroed with a mask.
+        active_pending = ai._pending_green
+        if np is not None:
+            if active_pending:
+                idxs = [tls_idx[t] for t in active_pending]
+                pending_age[idxs] += 1
+                for tlsID, i in zip(active_pending, idxs):
+                    if pending_age[i] > 100:
+                        obs['stuck_pending'].append((step, tlsID))
+                cleared = pending_age != 0
+                cleared[idxs] = False
+                pending_age[cleared] = 0
+            elif pending_age.any():
+                pending_age[:] = 0
+        else:
+            ages = obs['pending_age']
+            if active_pending:
+                for tlsID in active_pending:
+                    age = ages.get(tlsID, 0) + 1
+                    ages[tlsID] = age
+                    if age > 100:
+                        obs['stuck_pending'].append((step, tlsID))
+                for tlsID in ages.keys() - active_pending.keys():
+                    ages[tlsID] = 0  # reset when cleared
+            elif ages:
+                ages.clear()
 
         # Console progress
         if step % 100 == 0:
-            veh = len(traci.vehicle.getIDList())
+            # getIDCount() returns the integer directly — getIDList()
+            # would serialize every vehicle ID just to take its len()
+            veh = traci.vehicle.getIDCount()
             stats = ai.get_stats()
             total_sw = sum(stats['total_switches'].values())
             print(f"  step={step:>3} t={sim_time:>6.1f}s "
                   f"vehicles={veh:>4} total_switches={total_sw}")
 
+    # Rebuild the dict views the tests consume (nonzero entries only,
+    # matching the old incremental-dict behaviour)
+    obs['yellow_steps_per_tls'] = {t: int(c) for t, c in zip(all_tls, yellow_counts) if c}
+    obs['red_steps_per_tls']    = {t: int(c) for t, c in zip(all_tls, red_counts) if c}
+
+    # Grand total computed once from the counter array (two tests below
+    # each re-summed the dict values)
+    total_yellow_steps = int(yellow_counts.sum()) if np is not None         else sum(yellow_counts)
+
+    # Trim the typed sample buffers to their cursors and rebuild the
+    # tuple views the tests consume
+    if np is not None:
+        dur_tls     = dur_tls[:dur_cursor]
+        dur_remain  = dur_remain[:dur_cursor]
+        score_tls   = score_tls[:score_cursor]
+        score_phase = score_phase[:score_cursor]
+        score_vals  = score_vals[:score_cursor]
+        obs['duration_samples'] = [
+            (all_tls[i], r) for i, r in zip(dur_tls.tolist(), dur_remain.tolist())]
+        obs['score_samples'] = [
+            (all_tls[i], p, v) for i, p, v in
+            zip(score_tls.tolist(), score_phase.tolist(), score_vals.tolist())]
+
     # Capture final state before closing
     final_stats        = ai.get_stats()
     final_skip_counts  = {t: dict(v) for t, v in ai._skip_counts.items()}
@@ -221,7 +411,7 @@ def run():
     for tlsID in all_tls:
         try:
             p = traci.trafficlight.getPhase(tlsID)
-            final_phase_types[tlsID] = mapper.get_phase_type(tlsID, p)
+            final_phase_types[tlsID] = phase_types[tlsID][p]
         except traci.exceptions.TraCIException:
             final_phase_types[tlsID] = 'error'
 
@@ -230,6 +420,19 @@ def run():
     print(f"\n[INFO] Total switches: {sum(final_stats['total_switches'].values())}")
     print("-"*65)
 
+    # SoA views of the per-TLS report data: gather the switch counts and
+    # the single-phase flags into parallel arrays once, so the detail
+    # table (and the group-2 tests) index by position instead of doing
+    # dict/set lookups per row.
+    _sw = final_stats['total_switches']
+    if np is not None:
+        sw_arr      = np.fromiter((_sw.get(t, 0) for t in all_tls), np.int32, n_tls)
+        single_mask = np.fromiter((t in SINGLE_PHASE_TLS for t in all_tls),
+                                  np.bool_, n_tls)
+    else:
+        sw_arr      = [_sw.get(t, 0) for t in all_tls]
+        single_mask = [t in SINGLE_PHASE_TLS for t in all_tls]
+
     # ══════════════════════════════════════════════════════════════════════════
     # GROUP 1: PHASE TYPE CORRECTNESS
     # ══════════════════════════════════════════════════════════════════════════
@@ -256,7 +459,7 @@ def run():
                 "No yellow phases observed in 500 steps — "
                 "SUMO may not be cycling or all TLS stuck in green"
             )
-        total_yellow = sum(obs['yellow_steps_per_tls'].values())
+        total_yellow = total_yellow_steps
         # Show per-TLS breakdown
         lines = []
         for tlsID in all_tls:
@@ -307,6 +510,18 @@ def run():
     switch_counts = final_stats['total_switches']
 
     def test_single_phase_no_switches():
+        if np is not None:
+            # One masked comparison over the SoA arrays replaces the
+            # per-TLS dict lookups; offenders are formatted only on fail
+            bad = single_mask & (sw_arr != 0)
+            if bad.any():
+                raise ValueError('\n'.join(
+                    f"'{all_tls[i]}': {int(sw_arr[i])} switches "
+                    f"(expected 0 — single-phase TLS)"
+                    for i in np.where(bad)[0]))
+            lines = [f"'{all_tls[i][:30]}': switches={int(sw_arr[i])}"
+                     for i in np.where(single_mask)[0]]
+            return "Single-phase TLS correctly show 0 switches:\n  " + '\n  '.join(lines)
         issues = []
         for tlsID in single_tls:
             sw = switch_counts.get(tlsID, 0)
@@ -367,11 +582,29 @@ def run():
     def test_durations_in_bounds():
         if not obs['duration_samples']:
             raise ValueError("No duration samples collected — green phase never sampled")
+        # remaining time can legitimately be > MAX_GREEN because SUMO tracks
+        # the full phase duration, not just our assigned portion.
+        # But it must be > 0 and not impossibly large.
+        if np is not None:
+            # One C-level mask over the typed buffer; only drop into
+            # Python to format the (rare) offenders.
+            oob = (dur_remain < 0) | (dur_remain > 200)
+            if oob.any():
+                lines = []
+                for i in np.where(oob)[0][:3]:
+                    r   = float(dur_remain[i])
+                    why = "negative" if r < 0 else ">200s suspicious"
+                    lines.append(f"'{all_tls[int(dur_tls[i])][:25]}': "
+                                 f"remaining={r:.1f}s ({why})")
+                raise ValueError('\n'.join(lines))
+            return (
+                f"{dur_remain.size} duration samples | "
+                f"min={dur_remain.min():.1f}s max={dur_remain.max():.1f}s "
+                f"avg={dur_remain.mean():.1f}s\n"
+                f"  (Values near 0 = sampled near switch, large = fresh green — both OK)"
+            )
         out_of_bounds = []
         for (tlsID, remaining) in obs['duration_samples']:
-            # remaining time can legitimately be > MAX_GREEN because SUMO tracks
-            # the full phase duration, not just our assigned portion.
-            # But it must be > 0 and not impossibly large.
             if remaining < 0:
                 out_of_bounds.append(f"'{tlsID[:25]}': remaining={remaining:.1f}s (negative)")
             elif remaining > 200:
@@ -410,6 +643,26 @@ def run():
     def test_scores_in_range():
         if not obs['score_samples']:
             raise ValueError("No score samples collected")
+        if np is not None:
+            # np.isfinite rejects NaN and Inf in the same C pass as the
+            # range test — one mask over the typed score buffer
+            bad_mask = ~(np.isfinite(score_vals) &
+                         (score_vals >= 0.0) & (score_vals <= 1.51))
+            if bad_mask.any():
+                idx = np.where(bad_mask)[0]
+                raise ValueError(
+                    f"{idx.size} scores outside valid range [0.0, 1.5]:\n" +
+                    '\n'.join(f"  TLS='{all_tls[int(score_tls[i])][:20]}' "
+                               f"phase={int(score_phase[i])} "
+                               f"score={float(score_vals[i]):.4f}"
+                               for i in idx[:3])
+                )
+            return (
+                f"{score_vals.size} score samples | "
+                f"min={score_vals.min():.4f} max={score_vals.max():.4f} "
+                f"avg={score_vals.mean():.4f}\n"
+                f"  All in valid range [0.0, 1.5] — no NaN or Inf"
+            )
         bad = [(t, p, s) for (t, p, s) in obs['score_samples']
                if math.isnan(s) or math.isinf(s) or s < 0.0 or s > 1.51]
         if bad:
@@ -517,7 +770,7 @@ def run():
         # So total_yellow_steps >= total_switches (usually much more, since
         # yellow lasts multiple steps, but at minimum 1 per switch).
         total_switches = sum(switch_counts.values())
-        total_yellow   = sum(obs['yellow_steps_per_tls'].values())
+        total_yellow   = total_yellow_steps
         if total_switches > 0 and total_yellow == 0:
             raise ValueError(
                 f"Switches={total_switches} but yellow_steps=0.\n"
@@ -544,9 +797,9 @@ def run():
     print(f"\n[DETAIL] Per-TLS switch count and phase time served:")
     print(f"  {'TLS ID':<35} {'Switches':>8} {'Type':<8} {'Time Served'}")
     print(f"  {'-'*75}")
-    for tlsID in all_tls:
-        sw      = switch_counts.get(tlsID, 0)
-        ttype   = "single" if tlsID in SINGLE_PHASE_TLS else "multi"
+    for i, tlsID in enumerate(all_tls):
+        sw      = sw_arr[i]
+        ttype   = "single" if single_mask[i] else "multi"
         served  = final_time_served.get(tlsID, {})
         served_str = " | ".join(f"p{p}:{v:.0f}s" for p, v in served.items())
         sid = (tlsID[:33] + '..') if len(tlsID) > 35 else tlsID
@@ -57,6 +57,7 @@ import os
 import sys
 import csv
 import math
+from array import array
 
 TEST_DIR = os.path.dirname(os.path.abspath(__file__))
 ROOT_DIR = os.path.dirname(TEST_DIR)
@@ -73,7 +74,18 @@ from config import (
 setup_sumo_path()
 validate_config()
 
-import traci
+# Prefer libsumo: same API, but SUMO runs in-process so every per-step
+# call (simulationStep, getIDList, the engine's getNextTLS probes, ...)
+# is a direct function call instead of a socket round-trip. Registering
+# it as 'traci' makes the src modules share the same binding; the
+# traci.exceptions.* names used below exist in libsumo too.
+try:
+    import libsumo as traci
+    sys.modules["traci"] = traci
+    print("[TEST] Using libsumo (in-process SUMO binding)")
+except ImportError:
+    import traci
+import traci.constants as tc
 from phase_mapper            import PhaseLaneMapper
 from data_collector          import TrafficDataCollector
 from ai_signal_controller    import AISignalController
@@ -112,13 +124,18 @@ obs = {
     'ambulance_route_length_m'  : 0.0,   # estimated total length
     'preemption_events'         : [],
     'restoration_events'        : [],
+    'preempted_tls_set'         : set(),   # tls_ids, built as events arrive
+    'restored_tls_set'          : set(),
     'override_states_seen'      : {},     # {tls_id: state_string}
     'max_simultaneous_preempted': 0,
+    'emergency_flags'           : bytearray(),    # 1 byte per loop iteration
+    'preempted_counts'          : array('H'),     # preempted TLS per iteration
     'final_preempted_set'       : set(),
     'final_summary'             : {},
     'final_ai_stats'            : {},
     'switches_at_start'         : {},
     'switches_at_end'           : {},
+    'edge_length_cache'         : {},     # {edgeID: lane-0 length, m}
     'sim_error'                 : None,
 }
 
@@ -132,11 +149,12 @@ def _debug_ambulance_route():
     try:
         edges = traci.vehicle.getRoute(AMBULANCE_ID)
         obs['ambulance_route_edges'] = list(edges)
-        total_len = sum(
-            traci.lane.getLength(f"{e}_0")
-            for e in edges
-            if traci.lane.getLength(f"{e}_0") > 0
-        )
+        # One getLength() per edge — the old generator asked TraCI twice
+        # per edge (once in the filter, once in the sum). Cache the
+        # lengths for any later route diagnostics.
+        lengths = [traci.lane.getLength(f"{e}_0") for e in edges]
+        obs['edge_length_cache'] = dict(zip(edges, lengths))
+        total_len = sum(L for L in lengths if L > 0)
         obs['ambulance_route_length_m'] = total_len
         speed = traci.vehicle.getMaxSpeed(AMBULANCE_ID)
         est_time = total_len / max(speed, 1.0)
@@ -165,6 +183,35 @@ def _debug_ambulance_route():
         print(f"  [ROUTE DIAGNOSTIC] Could not read route: {e}")
 
 
+def _load_csv_once():
+    """
+    Read STEP_LOG_CSV exactly once and cache it for every check below.
+
+    Four tests previously each did list(csv.DictReader(open(...))) —
+    four full reads and materializations of the same file, plus an
+    unclosed handle each time. The int-typed columns the checks scan
+    are parsed once into compact array('i') buffers here so no test
+    re-runs int() over every row.
+    """
+    if obs.get('csv_rows') is None:
+        with open(STEP_LOG_CSV, newline='') as f:
+            reader = csv.reader(f)
+            header = next(reader)
+            rows   = [tuple(r) for r in reader]
+        # plain tuples + a name→index map: no per-row dict allocation or
+        # key hashing like DictReader
+        idx = {name: i for i, name in enumerate(header)}
+        obs['csv_rows'] = rows
+        obs['csv_idx']  = idx
+        st_i, ea_i = idx['step'], idx['emergency_active']
+        pt_i, at_i = idx['preempted_tls_count'], idx['active_tls_count']
+        obs['csv_steps']      = array('i', (int(r[st_i]) for r in rows))
+        obs['csv_emergency']  = array('i', (int(r[ea_i]) for r in rows))
+        obs['csv_preempted']  = array('i', (int(r[pt_i]) for r in rows))
+        obs['csv_active_tls'] = array('i', (int(r[at_i]) for r in rows))
+    return obs['csv_rows']
+
+
 def run():
     print("\n" + "="*65)
     print("CHUNK 5: EMERGENCY VEHICLE PREEMPTION TEST")
@@ -226,7 +273,16 @@ def run():
     multi_tls = [t for t in all_tls if mapper.has_multiple_green_phases(t)]
 
     obs['switches_at_start'] = {t: 0 for t in all_tls}
-    prev_event_count = 0
+
+    # One simulation-domain subscription replaces the per-step getTime()
+    # and getIDList() calls: the clock plus the departed/arrived deltas
+    # arrive in a single batch, and the active-vehicle set is maintained
+    # incrementally instead of re-fetched in full every step.
+    traci.simulation.subscribe([tc.VAR_TIME,
+                                tc.VAR_DEPARTED_VEHICLES_IDS,
+                                tc.VAR_ARRIVED_VEHICLES_IDS,
+                                tc.VAR_MIN_EXPECTED_VEHICLES])
+    active_vehicles = set(traci.vehicle.getIDList())
 
     print(f"[INFO] {len(all_tls)} TLS | {len(multi_tls)} multi-phase")
     print(f"[INFO] Waiting for ambulance '{AMBULANCE_ID}' in network...\n")
@@ -246,7 +302,18 @@ def run():
                 break
 
             traci.simulationStep()
-            sim_time = traci.simulation.getTime()
+            sim      = traci.simulation.getSubscriptionResults()
+            sim_time = sim[tc.VAR_TIME]
+            active_vehicles.update(sim[tc.VAR_DEPARTED_VEHICLES_IDS])
+            active_vehicles.difference_update(sim[tc.VAR_ARRIVED_VEHICLES_IDS])
+
+            # Early exit: nothing left in the network and nothing still to
+            # depart — no point burning the remaining step budget. The value
+            # rides the existing subscription batch, so this costs no extra
+            # TraCI round-trip. step > 50 guard as above.
+            if sim[tc.VAR_MIN_EXPECTED_VEHICLES] == 0 and step > 50:
+                print(f"\n[INFO] Network empty at step {step} — ending early")
+                break
 
             # Emergency first
             engine.step(sim_time, step)
@@ -259,6 +326,12 @@ def run():
             preempted_now = engine.get_preempted_tls()
             emergency_now = engine.is_ambulance_active()
 
+            # In-memory per-step record — compact typed arrays, so the CSV
+            # checks below have a ground truth that doesn't depend on the
+            # logger's CSV_LOG_INTERVAL sampling.
+            obs['emergency_flags'].append(1 if emergency_now else 0)
+            obs['preempted_counts'].append(len(preempted_now))
+
             # Log step (writes CSV)
             logger.log_step(
                 step             = step,
@@ -270,32 +343,30 @@ def run():
             )
 
             # ── OBSERVATIONS ─────────────────────────────────────────────────
-            vehicles = traci.vehicle.getIDList()
-
             # Ambulance first detection + route diagnostic
-            if obs['ambulance_first_seen_step'] is None and AMBULANCE_ID in vehicles:
+            if obs['ambulance_first_seen_step'] is None and AMBULANCE_ID in active_vehicles:
                 obs['ambulance_first_seen_step'] = step
                 print(f"  [OBS] Ambulance '{AMBULANCE_ID}' first seen at step {step}")
                 _debug_ambulance_route()
 
-            # Engine activation
-            if obs['engine_active_step'] is None and engine.is_ambulance_active():
+            # Engine activation (reuse the flag fetched above for the logger)
+            if obs['engine_active_step'] is None and emergency_now:
                 obs['engine_active_step'] = step
 
-            # Track preemption/restoration events
-            event_log = engine.get_event_log()
-            if len(event_log) > prev_event_count:
-                for evt in event_log[prev_event_count:]:
-                    if evt['type'] == 'PREEMPTED':
-                        obs['preemption_events'].append(evt.copy())
-                        obs['override_states_seen'][evt['tls_id']] = evt.get('state','')
-                        print(f"  [OBS] PREEMPTED '{evt['tls_id'][:35]}' "
-                              f"dist={evt.get('distance',0):.1f}m "
-                              f"state='{evt.get('state','')}'")
-                    elif evt['type'] == 'RESTORED':
-                        obs['restoration_events'].append(evt.copy())
-                        print(f"  [OBS] RESTORED  '{evt['tls_id'][:35]}'")
-                prev_event_count = len(event_log)
+            # Track preemption/restoration events — drain only the unread
+            # tail instead of copying and slicing the full log every step
+            for evt in engine.drain_new_events():
+                if evt['type'] == 'PREEMPTED':
+                    obs['preemption_events'].append(evt.copy())
+                    obs['preempted_tls_set'].add(evt['tls_id'])
+                    obs['override_states_seen'][evt['tls_id']] = evt.get('state','')
+                    print(f"  [OBS] PREEMPTED '{evt['tls_id'][:35]}' "
+                          f"dist={evt.get('distance',0):.1f}m "
+                          f"state='{evt.get('state','')}'")
+                elif evt['type'] == 'RESTORED':
+                    obs['restoration_events'].append(evt.copy())
+                    obs['restored_tls_set'].add(evt['tls_id'])
+                    print(f"  [OBS] RESTORED  '{evt['tls_id'][:35]}'")
 
             # Max simultaneous
             obs['max_simultaneous_preempted'] = max(
@@ -304,13 +375,12 @@ def run():
 
             # Progress every 100 steps
             if step % 100 == 0:
-                stats = ai.get_stats()
-                total_sw = sum(stats['total_switches'].values())
+                total_sw = ai.total_switch_count()
                 print(f"  step={step:>3} t={sim_time:>6.1f}s "
-                      f"vehicles={len(vehicles):>4} "
+                      f"vehicles={len(active_vehicles):>4} "
                       f"preempted={len(preempted_now)} "
                       f"switches={total_sw} "
-                      f"ambul={engine.is_ambulance_active()}")
+                      f"ambul={emergency_now}")
 
     except traci.exceptions.FatalTraCIError:
         print("\n[INFO] SUMO connection closed (headless — should not happen)")
@@ -321,8 +391,10 @@ def run():
         # Capture final state
         obs['final_preempted_set'] = engine.get_preempted_tls()
         obs['final_summary']       = engine.get_summary()
-        obs['final_ai_stats']      = ai.get_stats()
-        obs['switches_at_end']     = dict(ai.get_stats().get('total_switches', {}))
+        # get_stats() builds fresh dicts — snapshot it once and derive
+        final_stats                = ai.get_stats()
+        obs['final_ai_stats']      = final_stats
+        obs['switches_at_end']     = final_stats.get('total_switches', {})
 
         # Write summary report (with emergency stats)
         logger.finish(obs['final_ai_stats'], obs['final_summary'])
@@ -417,7 +489,7 @@ def _run_checks_after_sim():
                 f"  within {AMBULANCE_DETECTION_RANGE}m of a traffic light.\n"
                 f"  Try increasing AMBULANCE_DETECTION_RANGE in config.py to 300m."
             )
-        tls_ids = {e['tls_id'] for e in obs['preemption_events']}
+        tls_ids = obs['preempted_tls_set']
         return f"{n} preemption events across {len(tls_ids)} unique TLS"
     check("At least 1 TLS was preempted during ambulance run", test_at_least_one_preemption)
 
@@ -437,43 +509,56 @@ def _run_checks_after_sim():
     check("Override state gives green to ambulance direction", test_override_state_correct)
 
     def test_emergency_active_in_csv():
+        # Source of truth is the in-memory flag array captured every loop
+        # iteration; the CSV is only sanity-checked against it.
+        flags = obs['emergency_flags']
+        n_em  = flags.count(1)
+        if n_em == 0:
+            raise ValueError(
+                "emergency flag never set during the run.\n"
+                "  Check that engine.is_ambulance_active() returns True during run."
+            )
         if not os.path.isfile(STEP_LOG_CSV):
             raise FileNotFoundError(f"CSV not found: {STEP_LOG_CSV}")
-        rows = list(csv.DictReader(open(STEP_LOG_CSV)))
+        rows = _load_csv_once()
         if not rows:
             raise ValueError("CSV is empty")
-        emergency_rows = [r for r in rows if int(r.get('emergency_active', 0)) == 1]
-        if len(emergency_rows) == 0:
+        if 1 not in obs['csv_emergency']:
             raise ValueError(
-                "emergency_active=0 for all CSV rows.\n"
-                "  This means the logger never received emergency_active=True.\n"
-                "  Check that engine.is_ambulance_active() returns True during run."
+                f"Emergency active for {n_em} steps in memory but "
+                f"emergency_active=0 in every CSV row — logger wiring broken."
             )
+        first = flags.index(1)
+        last  = len(flags) - 1 - flags[::-1].index(1)
         return (
-            f"emergency_active=1 in {len(emergency_rows)}/{len(rows)} rows\n"
-            f"       Steps: {emergency_rows[0]['step']} to {emergency_rows[-1]['step']}"
+            f"emergency active {n_em}/{len(flags)} steps (steps {first} to {last})\n"
+            f"       CSV agrees: emergency_active=1 rows present"
         )
-    check("CSV records emergency_active=1 during ambulance phase", test_emergency_active_in_csv)
+    check("Emergency-active flag recorded during ambulance phase", test_emergency_active_in_csv)
 
     def test_preempted_count_in_csv():
-        if not os.path.isfile(STEP_LOG_CSV):
-            raise FileNotFoundError(STEP_LOG_CSV)
-        rows = list(csv.DictReader(open(STEP_LOG_CSV)))
-        preempted_rows = [(r['step'], int(r.get('preempted_tls_count', 0)))
-                         for r in rows if int(r.get('preempted_tls_count', 0)) > 0]
-        if not preempted_rows and len(obs['preemption_events']) > 0:
+        counts   = obs['preempted_counts']
+        n_active = sum(1 for c in counts if c > 0)
+        if n_active == 0 and len(obs['preemption_events']) > 0:
             raise ValueError(
-                "Preemptions happened but preempted_tls_count=0 in CSV.\n"
-                "  Check that engine.get_preempted_tls() is passed to logger."
+                "Preemptions happened but the per-step count never went above 0.\n"
+                "  Check that engine.get_preempted_tls() reflects active overrides."
             )
-        if preempted_rows:
-            max_cnt = max(c for _, c in preempted_rows)
+        if not os.path.isfile(STEP_LOG_CSV):
+            raise FileNotFoundError(STEP_LOG_CSV)
+        _load_csv_once()
+        if n_active:
+            if len(obs['preemption_events']) > 0 and max(obs['csv_preempted']) == 0:
+                raise ValueError(
+                    "Preemptions recorded in memory but preempted_tls_count=0 in\n"
+                    "  every CSV row — check logger wiring."
+                )
             return (
-                f"preempted_tls_count > 0 in {len(preempted_rows)} rows\n"
-                f"       Max simultaneous: {max_cnt} TLS preempted"
+                f"preempted count > 0 in {n_active}/{len(counts)} steps\n"
+                f"       Max simultaneous: {max(counts)} TLS preempted"
             )
-        return "No preemptions in CSV (ambulance may not have crossed TLS)"
-    check("CSV preempted_tls_count recorded during preemption", test_preempted_count_in_csv)
+        return "No preemptions recorded (ambulance may not have crossed TLS)"
+    check("Preempted-TLS count recorded during preemption", test_preempted_count_in_csv)
 
     # ══════════════════════════════════════════════════════════════════════════
     # GROUP 3: AI SKIPS PREEMPTED TLS
@@ -520,9 +605,9 @@ def _run_checks_after_sim():
                 f"  TLS are stuck in override. Ambulance may not have left\n"
                 f"  the detection range before run ended."
             )
-        preempted_tls = {e['tls_id'] for e in obs['preemption_events']}
-        restored_tls  = {e['tls_id'] for e in obs['restoration_events']}
-        not_restored  = preempted_tls - restored_tls
+        # Sets were built incrementally as events arrived — no need to
+        # rescan the event lists here.
+        not_restored = obs['preempted_tls_set'] - obs['restored_tls_set']
         if not_restored:
             return (
                 f"{n_r}/{n_p} preemptions restored.\n"
@@ -597,12 +682,12 @@ def _run_checks_after_sim():
     def test_csv_valid():
         if not os.path.isfile(STEP_LOG_CSV):
             raise FileNotFoundError(STEP_LOG_CSV)
-        rows = list(csv.DictReader(open(STEP_LOG_CSV)))
+        rows = _load_csv_once()
         if len(rows) < 10:
             raise ValueError(f"Only {len(rows)} rows in CSV — run too short")
+        wt_i = obs['csv_idx']['avg_wait_time']
         bad = [r for r in rows
-               if not r.get('avg_wait_time', '').strip()
-               or math.isnan(float(r['avg_wait_time']))]
+               if not r[wt_i].strip() or math.isnan(float(r[wt_i]))]
         if bad:
             raise ValueError(f"{len(bad)} rows have invalid avg_wait_time")
         return f"CSV: {len(rows)} valid rows — no NaN or empty values"
@@ -626,8 +711,8 @@ def _run_checks_after_sim():
     def test_active_tls_reflects_preemption():
         if not os.path.isfile(STEP_LOG_CSV):
             raise FileNotFoundError(STEP_LOG_CSV)
-        rows = list(csv.DictReader(open(STEP_LOG_CSV)))
-        counts = [int(r['active_tls_count']) for r in rows]
+        _load_csv_once()
+        counts = obs['csv_active_tls']
         min_c, max_c = min(counts), max(counts)
         if len(obs['preemption_events']) > 0 and min_c == 10:
             return (